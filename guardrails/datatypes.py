@@ -1,12 +1,15 @@
 import datetime
 import logging
 import warnings
+from copy import deepcopy
 from dataclasses import dataclass
+from functools import lru_cache
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any, Dict, Generator, Iterable
 from typing import List
 from typing import List as TypedList
-from typing import Tuple, Type, Union
+from typing import Optional, Tuple, Type, Union
+from weakref import WeakKeyDictionary
 
 from lxml import etree as ET
 from pydantic import BaseModel
@@ -21,17 +24,53 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# Validator classes resolved on first use. `guardrails.validators` imports this
+# module from `register_validator`, before all of its validators are defined.
+_lazy_validators: Dict[str, Type[Validator]] = {}
+
+
+def _lazy_validator(name: str) -> Type[Validator]:
+    validator = _lazy_validators.get(name)
+    if validator is None:
+        import guardrails.validators as validators_module
+
+        validator = _lazy_validators[name] = getattr(validators_module, name)
+    return validator
+
+
 def update_deprecated_type_to_string(type):
     if type in deprecated_string_types:
         return "string"
     return type
 
 
+# Common boolean spellings, so `Boolean.from_str` can skip `str.lower`.
+_BOOL_MAP = {
+    "true": True,
+    "True": True,
+    "TRUE": True,
+    "false": False,
+    "False": False,
+    "FALSE": False,
+}
+
+
+# <object /> elements built by `Pydantic.to_object_element`, per Pydantic model
+# and then per (name, description) of the <pydantic /> element.
+_pydantic_object_elements: WeakKeyDictionary = WeakKeyDictionary()
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(s: str, fmt: str) -> datetime.datetime:
+    """Memoized `datetime.strptime`, shared by the date and time types."""
+    return datetime.datetime.strptime(s, fmt)
+
+
 @dataclass
 class FieldValidation:
     key: Any
     value: Any
-    validators: TypedList[Validator]
+    validators: Tuple[Validator, ...]
     children: TypedList["FieldValidation"]
 
 
@@ -52,6 +91,8 @@ def verify_metadata_requirements(
 
 
 class DataType:
+    __slots__ = ("_children", "_children_ns", "format_attr", "element")
+
     def __init__(
         self,
         children: Dict[str, Any],
@@ -59,11 +100,12 @@ class DataType:
         element: ET._Element,
     ) -> None:
         self._children = children
+        self._children_ns = None
         self.format_attr = format_attr
         self.element = element
 
     @property
-    def validators(self) -> TypedList:
+    def validators(self) -> Tuple[Validator, ...]:
         return self.format_attr.validators
 
     def __repr__(self) -> str:
@@ -89,11 +131,13 @@ class DataType:
         Yields tuples of (name, child_data_type, child_element) for each
         child.
         """
-        for el_child in element:
-            if element.tag == "list":
-                assert len(self._children) == 1, "Must have exactly one child."
-                yield None, list(self._children.values())[0], el_child
-            else:
+        if element.tag == "list" and len(element):
+            assert len(self._children) == 1, "Must have exactly one child."
+            item_type = next(iter(self._children.values()))
+            for el_child in element:
+                yield None, item_type, el_child
+        else:
+            for el_child in element:
                 name: str = el_child.attrib["name"]
                 child_data_type: DataType = self._children[name]
                 yield name, child_data_type, el_child
@@ -131,7 +175,7 @@ class DataType:
         value = self.from_str(value)
         return self._constructor_validation(key, value)
 
-    def set_children(self, element: ET._Element):
+    def set_children(self, element: ET._Element, strict: bool = False):
         raise NotImplementedError("Abstract method.")
 
     @classmethod
@@ -145,13 +189,18 @@ class DataType:
         format_attr.get_validators(strict)
 
         data_type = cls({}, format_attr, element)
-        data_type.set_children(element)
+        data_type.set_children(element, strict)
         return data_type
 
     @property
     def children(self) -> SimpleNamespace:
-        """Return a SimpleNamespace of the children of this DataType."""
-        return SimpleNamespace(**self._children)
+        """Return a SimpleNamespace of the children of this DataType.
+
+        The namespace is built on first access and reset by `set_children`.
+        """
+        if self._children_ns is None:
+            self._children_ns = SimpleNamespace(**self._children)
+        return self._children_ns
 
 
 registry: Dict[str, DataType] = {}
@@ -177,46 +226,50 @@ versions 0.3.0 and beyond. Use the pydantic 'str' primitive instead.""",
 
 
 class ScalarType(DataType):
-    def set_children(self, element: ET._Element):
+    __slots__ = ()
+
+    def set_children(self, element: ET._Element, strict: bool = False):
         for _ in element:
             raise ValueError("ScalarType data type must not have any children.")
 
 
 class NonScalarType(DataType):
-    pass
+    __slots__ = ()
 
 
 @register_type("string")
 class String(ScalarType):
     """Element tag: `<string>`"""
 
-    def from_str(self, s: str) -> "String":
-        """Create a String from a string."""
-        return to_string(s)
+    __slots__ = ()
+
+    from_str = staticmethod(to_string)
 
 
 @register_type("integer")
 class Integer(ScalarType):
     """Element tag: `<integer>`"""
 
-    def from_str(self, s: str) -> "Integer":
-        """Create an Integer from a string."""
-        return to_int(s)
+    __slots__ = ()
+
+    from_str = staticmethod(to_int)
 
 
 @register_type("float")
 class Float(ScalarType):
     """Element tag: `<float>`"""
 
-    def from_str(self, s: str) -> "Float":
-        """Create a Float from a string."""
-        return to_float(s)
+    __slots__ = ()
+
+    from_str = staticmethod(to_float)
 
 
 @register_type("bool")
 class Boolean(ScalarType):
     """Element tag: `<bool>`"""
 
+    __slots__ = ()
+
     def from_str(self, s: Union[str, bool]) -> "Boolean":
         """Create a Boolean from a string."""
         if s is None:
@@ -225,12 +278,16 @@ class Boolean(ScalarType):
         if isinstance(s, bool):
             return s
 
-        if s.lower() == "true":
-            return True
-        elif s.lower() == "false":
-            return False
-        else:
-            raise ValueError(f"Invalid boolean value: {s}")
+        if isinstance(s, str):
+            try:
+                return _BOOL_MAP[s]
+            except KeyError:
+                pass
+            # Fall back to case-insensitive matching for less common spellings.
+            value = _BOOL_MAP.get(s.lower())
+            if value is not None:
+                return value
+        raise ValueError(f"Invalid boolean value: {s}")
 
 
 @register_type("date")
@@ -241,6 +298,8 @@ class Date(ScalarType):
     element. E.g. `<date name="..." ... date-format="%Y-%m-%d" />`
     """
 
+    __slots__ = ("date_format",)
+
     def __init__(
         self, children: Dict[str, Any], format_attr: "FormatAttr", element: ET._Element
     ) -> None:
@@ -252,14 +311,17 @@ class Date(ScalarType):
         if s is None:
             return None
 
-        return datetime.datetime.strptime(s, self.date_format).date()
+        return _parse_datetime(s, self.date_format).date()
 
     @classmethod
     def from_xml(cls, element: ET._Element, strict: bool = False) -> "DataType":
         datatype = super().from_xml(element, strict)
 
-        if "date-format" in element.attrib or "date_format" in element.attrib:
-            datatype.date_format = element.attrib["date-format"]
+        date_format = element.attrib.get(
+            "date-format", element.attrib.get("date_format")
+        )
+        if date_format is not None:
+            datatype.date_format = date_format
 
         return datatype
 
@@ -272,6 +334,8 @@ class Time(ScalarType):
     element. E.g. `<time name="..." ... time-format="%H:%M:%S" />`
     """
 
+    __slots__ = ("time_format",)
+
     def __init__(
         self, children: Dict[str, Any], format_attr: "FormatAttr", element: ET._Element
     ) -> None:
@@ -283,14 +347,17 @@ class Time(ScalarType):
         if s is None:
             return None
 
-        return datetime.datetime.strptime(s, self.time_format).time()
+        return _parse_datetime(s, self.time_format).time()
 
     @classmethod
     def from_xml(cls, element: ET._Element, strict: bool = False) -> "DataType":
         datatype = super().from_xml(element, strict)
 
-        if "time-format" in element.attrib or "time_format" in element.attrib:
-            datatype.date_format = element.attrib["time-format"]
+        time_format = element.attrib.get(
+            "time-format", element.attrib.get("time_format")
+        )
+        if time_format is not None:
+            datatype.time_format = time_format
 
         return datatype
 
@@ -300,34 +367,46 @@ class Time(ScalarType):
 class Email(ScalarType):
     """Element tag: `<email>`"""
 
+    __slots__ = ()
+
 
 @deprecate_type
 @register_type("url")
 class URL(ScalarType):
     """Element tag: `<url>`"""
 
+    __slots__ = ()
+
 
 @deprecate_type
 @register_type("pythoncode")
 class PythonCode(ScalarType):
     """Element tag: `<pythoncode>`"""
 
+    __slots__ = ()
+
 
 @deprecate_type
 @register_type("sql")
 class SQLCode(ScalarType):
     """Element tag: `<sql>`"""
 
+    __slots__ = ()
+
 
 @register_type("percentage")
 class Percentage(ScalarType):
     """Element tag: `<percentage>`"""
 
+    __slots__ = ()
+
 
 @register_type("list")
 class List(NonScalarType):
     """Element tag: `<list>`"""
 
+    __slots__ = ("_item_type",)
+
     def collect_validation(
         self,
         key: str,
@@ -341,16 +420,18 @@ class List(NonScalarType):
         if len(self._children) == 0:
             return validation
 
-        item_type = list(self._children.values())[0]
+        item_type = self._item_type
 
         # TODO(shreya): Edge case: List of lists -- does this still work?
-        for i, item in enumerate(value):
-            child_validation = item_type.collect_validation(i, item, value)
-            validation.children.append(child_validation)
+        collect_item = item_type.collect_validation
+        validation.children.extend(
+            collect_item(i, item, value) for i, item in enumerate(value)
+        )
 
         return validation
 
-    def set_children(self, element: ET._Element):
+    def set_children(self, element: ET._Element, strict: bool = False):
+        self._children_ns = None
         for idx, child in enumerate(element, start=1):
             if idx > 1:
                 # Only one child is allowed in a list data type.
@@ -358,13 +439,16 @@ class List(NonScalarType):
                 # must conform to.
                 raise ValueError("List data type must have exactly one child.")
             child_data_type = update_deprecated_type_to_string(registry[child.tag])
-            self._children["item"] = child_data_type.from_xml(child)
+            self._children["item"] = child_data_type.from_xml(child, strict)
+            self._item_type = self._children["item"]
 
 
 @register_type("object")
 class Object(NonScalarType):
     """Element tag: `<object>`"""
 
+    __slots__ = ("_child_items",)
+
     def collect_validation(
         self,
         key: str,
@@ -386,30 +470,38 @@ class Object(NonScalarType):
         # TODO(shreya): Implement key type and value type later
 
         # Check for required keys
-        for child_key, child_data_type in self._children.items():
+        get_value = value.get
+        append_child = validation.children.append
+        for child_key, child_data_type in self._child_items:
             # Value should be a dictionary
             # child_key is an expected key that the schema defined
             # child_data_type is the data type of the expected key
-            child_value = value.get(child_key, None)
+            child_value = get_value(child_key, None)
             child_validation = child_data_type.collect_validation(
                 child_key,
                 child_value,
                 value,
             )
-            validation.children.append(child_validation)
+            append_child(child_validation)
 
         return validation
 
-    def set_children(self, element: ET._Element):
+    def set_children(self, element: ET._Element, strict: bool = False):
+        self._children_ns = None
         for child in element:
             child_data_type = update_deprecated_type_to_string(registry[child.tag])
-            self._children[child.attrib["name"]] = child_data_type.from_xml(child)
+            self._children[child.attrib["name"]] = child_data_type.from_xml(
+                child, strict
+            )
+        self._child_items = tuple(self._children.items())
 
 
 @register_type("choice")
 class Choice(NonScalarType):
     """Element tag: `<object>`"""
 
+    __slots__ = ("discriminator_key",)
+
     def __init__(
         self, children: Dict[str, Any], format_attr: "FormatAttr", element: ET._Element
     ) -> None:
@@ -434,21 +526,26 @@ class Choice(NonScalarType):
 
         return validation
 
-    def set_children(self, element: ET._Element):
+    def set_children(self, element: ET._Element, strict: bool = False):
+        self._children_ns = None
         for child in element:
             child_data_type = update_deprecated_type_to_string(registry[child.tag])
             assert child_data_type == Case
-            self._children[child.attrib["name"]] = child_data_type.from_xml(child)
+            self._children[child.attrib["name"]] = child_data_type.from_xml(
+                child, strict
+            )
 
     @property
-    def validators(self) -> TypedList:
-        return []
+    def validators(self) -> Tuple[Validator, ...]:
+        return ()
 
 
 @register_type("case")
 class Case(NonScalarType):
     """Element tag: `<case>`"""
 
+    __slots__ = ("_child_items",)
+
     def __init__(
         self, children: Dict[str, Any], format_attr: "FormatAttr", element: ET._Element
     ) -> None:
@@ -464,30 +561,38 @@ class Case(NonScalarType):
         validation = self._constructor_validation(key, value)
 
         # Collect validation for all children
-        for child_key, child_data_type in self._children.items():
+        get_value = value.get
+        append_child = validation.children.append
+        for child_key, child_data_type in self._child_items:
             # Value should be a dictionary
             # child_key is an expected key that the schema defined
             # child_data_type is the data type of the expected key
-            child_value = value.get(child_key, None)
+            child_value = get_value(child_key, None)
             child_validation = child_data_type.collect_validation(
                 child_key,
                 child_value,
                 value,
             )
-            validation.children.append(child_validation)
+            append_child(child_validation)
 
         return validation
 
-    def set_children(self, element: ET._Element):
+    def set_children(self, element: ET._Element, strict: bool = False):
+        self._children_ns = None
         for child in element:
             child_data_type = update_deprecated_type_to_string(registry[child.tag])
-            self._children[child.attrib["name"]] = child_data_type.from_xml(child)
+            self._children[child.attrib["name"]] = child_data_type.from_xml(
+                child, strict
+            )
+        self._child_items = tuple(self._children.items())
 
 
 @register_type("pydantic")
 class Pydantic(NonScalarType):
     """Element tag: `<pydantic>`"""
 
+    __slots__ = ("model",)
+
     def __init__(
         self,
         model: Type[BaseModel],
@@ -506,8 +611,8 @@ class Pydantic(NonScalarType):
         self.model = model
 
     @property
-    def validators(self) -> TypedList:
-        from guardrails.validators import Pydantic as PydanticValidator
+    def validators(self) -> Tuple[Validator, ...]:
+        PydanticValidator = _lazy_validator("Pydantic")
 
         # Check if the <pydantic /> element has an `on-fail` attribute.
         # If so, use that as the `on_fail` argument for the PydanticValidator.
@@ -515,12 +620,15 @@ class Pydantic(NonScalarType):
         on_fail_attr_name = "on-fail-pydantic"
         if on_fail_attr_name in self.element.attrib:
             on_fail = self.element.attrib[on_fail_attr_name]
-        return [PydanticValidator(self.model, on_fail=on_fail)]
+        return (PydanticValidator(self.model, on_fail=on_fail),)
 
-    def set_children(self, element: ET._Element):
+    def set_children(self, element: ET._Element, strict: bool = False):
+        self._children_ns = None
         for child in element:
             child_data_type = update_deprecated_type_to_string(registry[child.tag])
-            self._children[child.attrib["name"]] = child_data_type.from_xml(child)
+            self._children[child.attrib["name"]] = child_data_type.from_xml(
+                child, strict
+            )
 
     @classmethod
     def from_xml(cls, element: ET._Element, strict: bool = False) -> "DataType":
@@ -534,17 +642,11 @@ class Pydantic(NonScalarType):
             raise ValueError(f"Invalid Pydantic model: {model_name}")
 
         data_type = cls(model, {}, FormatAttr(), element)
-        data_type.set_children(element)
+        data_type.set_children(element, strict)
         return data_type
 
     def to_object_element(self) -> ET._Element:
         """Convert the Pydantic data type to an <object /> element."""
-        from guardrails.utils.pydantic_utils import (
-            PYDANTIC_SCHEMA_TYPE_MAP,
-            get_field_descriptions,
-            pydantic_validators,
-        )
-
         # Get the following attributes
         # TODO: add on-fail
         try:
@@ -556,6 +658,23 @@ class Pydantic(NonScalarType):
         except KeyError:
             description = None
 
+        # The element only depends on the model, name and description, so it is
+        # built once and copied, since callers insert it into their own tree.
+        model_elements = _pydantic_object_elements.setdefault(self.model, {})
+        key = (name, description)
+        if key not in model_elements:
+            model_elements[key] = self._build_object_element(name, description)
+        return deepcopy(model_elements[key])
+
+    def _build_object_element(
+        self, name: Optional[str], description: Optional[str]
+    ) -> ET._Element:
+        from guardrails.utils.pydantic_utils import (
+            PYDANTIC_SCHEMA_TYPE_MAP,
+            get_field_descriptions,
+            pydantic_validators,
+        )
+
         # Get the Pydantic model schema.
         schema = self.model.schema()
         field_descriptions = get_field_descriptions(self.model)
@@ -565,20 +684,18 @@ class Pydantic(NonScalarType):
         #     <type name="..." description="..." format="semicolon separated validators" /> # noqa: E501
         # </object>
 
-        # Add the object element, opening tag
-        xml = ""
+        # Add the object element
+        root = ET.Element("object")
         root_validators = "; ".join(
             list(pydantic_validators[self.model]["__root__"].keys())
         )
-        xml += "<object "
         if name:
-            xml += f' name="{name}"'
+            root.set("name", name)
         if description:
-            xml += f' description="{description}"'
+            root.set("description", description)
         if root_validators:
-            xml += f' format="{root_validators}"'
-        xml += f' pydantic="{self.model.__name__}"'
-        xml += ">"
+            root.set("format", root_validators)
+        root.set("pydantic", self.model.__name__)
 
         # Add all the nested fields
         for field in schema["properties"]:
@@ -591,21 +708,13 @@ class Pydantic(NonScalarType):
                 field_description = field_descriptions[field]
             except KeyError:
                 field_description = ""
-            xml += f"<{field_type}"
-            xml += f' name="{field}"'
+            field_element = ET.SubElement(root, field_type, name=field)
             if field_description:
-                xml += f' description="{field_descriptions[field]}"'
+                field_element.set("description", field_description)
             if field_validators:
-                xml += f' format="{field_validators}"'
-            xml += " />"
-
-        # Close the object element
-        xml += "</object>"
+                field_element.set("format", field_validators)
 
-        # Convert the string to an XML element, making sure to format it.
-        return ET.fromstring(
-            xml, parser=ET.XMLParser(encoding="utf-8", remove_blank_text=True)
-        )
+        return root
 
 
 # @register_type("key")
@@ -1,12 +1,13 @@
+import ast
 import json
 import logging
 import pprint
-import re
 import warnings
 from copy import deepcopy
 from dataclasses import dataclass
+from functools import lru_cache
 from string import Formatter
-from types import SimpleNamespace
+from types import CodeType, SimpleNamespace
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from lxml import etree as ET
@@ -42,6 +43,8 @@ from guardrails.validators import (
     Validator,
     check_refrain_in_dict,
     filter_in_dict,
+    types_to_validators,
+    validators_registry,
 )
 
 if TYPE_CHECKING:
@@ -50,6 +53,76 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _split_outside_braces(s: str, sep: Optional[str] = None) -> List[str]:
+    """Split `s` on `sep`, or on any whitespace if `sep` is None, ignoring
+    separators that are inside curly braces.
+
+    Empty strings are dropped from the result.
+    """
+    parts = []
+    depth = 0
+    start = 0
+    for i, c in enumerate(s):
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            if depth:
+                depth -= 1
+        elif depth == 0 and (c == sep if sep is not None else c.isspace()):
+            parts.append(s[start:i])
+            start = i + 1
+    parts.append(s[start:])
+    return [part for part in parts if part]
+
+
+@lru_cache(maxsize=256)
+def _compile_expr(src: str) -> CodeType:
+    """Compile a Python expression from a format attribute to bytecode."""
+    return compile(src, "<FormatAttr>", "eval")
+
+
+@lru_cache(maxsize=1024)
+def _split_format_tokens(fmt: str) -> Tuple[str, ...]:
+    """Split a format string into its non-empty validator tokens."""
+    return tuple(_split_outside_braces(fmt, ";"))
+
+
+@lru_cache(maxsize=1024)
+def _parse_format_cached(fmt: str) -> Tuple[Tuple[str, Tuple[Any, ...]], ...]:
+    """Parse a format string into (validator name, args) pairs.
+
+    Only used for format strings without Python expressions, so every
+    argument is a plain string and the cached result is safe to share.
+    """
+    return tuple(
+        (name, tuple(args))
+        for name, args in map(FormatAttr.parse_token, _split_format_tokens(fmt))
+    )
+
+
+@lru_cache(maxsize=512)
+def _resolve_validators(
+    tag: str, fmt: Optional[str], num_registered: int
+) -> Tuple[Tuple[Tuple[str, Tuple[Any, ...]], ...], Tuple[str, ...]]:
+    """Split the validators in a format string into those registered for
+    `tag`, paired with their arguments, and the names of those that are not.
+
+    `num_registered` is the number of validators registered for `tag`.
+    Validators are only ever added to that list, so passing its length keeps
+    cached results from going stale when new validators are registered.
+    """
+    valid_names = types_to_validators[tag]
+    registered = []
+    unregistered = []
+    for validator_name, args in FormatAttr(fmt).parse().items():
+        if validator_name not in valid_names:
+            unregistered.append(validator_name)
+            continue
+        registered.append((validator_name, tuple(args)))
+
+    return tuple(registered), tuple(unregistered)
+
+
 @dataclass
 class FormatAttr:
     """Class for parsing and manipulating the `format` attribute of an element.
@@ -102,10 +175,7 @@ class FormatAttr:
         """
         if self.format is None:
             return []
-        pattern = re.compile(r";(?![^{}]*})")
-        tokens = re.split(pattern, self.format)
-        tokens = list(filter(None, tokens))
-        return tokens
+        return list(_split_format_tokens(self.format))
 
     @classmethod
     def parse_token(cls, token: str) -> Tuple[str, List[Any]]:
@@ -125,28 +195,28 @@ class FormatAttr:
 
         validator, args_token = validator_with_args
 
-        # Split using whitespace as a delimiter, but not if it is inside curly braces or
-        # single quotes.
-        pattern = re.compile(r"\s(?![^{}]*})|(?<!')\s(?=[^']*'$)")
-        tokens = re.split(pattern, args_token)
-
-        # Filter out empty strings if any.
-        tokens = list(filter(None, tokens))
+        # Split using whitespace as a delimiter, but not if it is inside curly braces.
+        tokens = _split_outside_braces(args_token)
 
         args = []
         for t in tokens:
             # If the token is enclosed in curly braces, it is a Python expression.
             t = t.strip()
             if t[0] == "{" and t[-1] == "}":
-                t = t[1:-1]
+                # `compile` rejects leading whitespace, unlike `eval` on a string.
+                t = t[1:-1].strip()
                 try:
-                    # Evaluate the Python expression.
-                    t = eval(t)
-                except (ValueError, SyntaxError, NameError) as e:
-                    raise ValueError(
-                        f"Python expression `{t}` is not valid, "
-                        f"and raised an error: {e}."
-                    )
+                    # Literals are the common case and don't need a full eval.
+                    t = ast.literal_eval(t)
+                except (ValueError, SyntaxError):
+                    try:
+                        # Evaluate the Python expression.
+                        t = eval(_compile_expr(t))
+                    except (ValueError, SyntaxError, NameError) as e:
+                        raise ValueError(
+                            f"Python expression `{t}` is not valid, "
+                            f"and raised an error: {e}."
+                        )
             args.append(t)
 
         return validator.strip(), args
@@ -161,6 +231,13 @@ class FormatAttr:
         if self.format is None:
             return {}
 
+        # Format strings without Python expressions are side-effect free to
+        # parse, so reuse the cached result.
+        if "{" not in self.format:
+            return {
+                name: list(args) for name, args in _parse_format_cached(self.format)
+            }
+
         # Split the format attribute into tokens: each is a validator.
         # Then, parse each token into a validator name and a list of parameters.
         validators = {}
@@ -172,8 +249,8 @@ class FormatAttr:
         return validators
 
     @property
-    def validators(self) -> List[Validator]:
-        """Get the list of validators from the format attribute.
+    def validators(self) -> Tuple[Validator, ...]:
+        """Get the validators from the format attribute.
 
         Only the validators that are registered for this element will be
         returned.
@@ -192,8 +269,8 @@ class FormatAttr:
         except AttributeError:
             raise AttributeError("Must call `get_validators` first.")
 
-    def get_validators(self, strict: bool = False) -> List[Validator]:
-        """Get the list of validators from the format attribute. Only the
+    def get_validators(self, strict: bool = False) -> Tuple[Validator, ...]:
+        """Get the validators from the format attribute. Only the
         validators that are registered for this element will be returned.
 
         For example, if the format attribute is "valid-url; is-reachable", and
@@ -206,49 +283,48 @@ class FormatAttr:
                 this element. If False, ignore the validator and print a warning.
 
         Returns:
-            A list of validators.
+            A tuple of validators.
         """
-        from guardrails.validators import types_to_validators, validators_registry
+        tag = self.element.tag
+        resolve = _resolve_validators
+        if self.format is not None and "{" in self.format:
+            # Python expressions may have side effects or return mutable
+            # arguments, so they are evaluated afresh for every element.
+            resolve = _resolve_validators.__wrapped__
+        registered, unregistered = resolve(
+            tag, self.format, len(types_to_validators[tag])
+        )
 
-        _validators = []
-        _unregistered_validators = []
-        parsed = self.parse().items()
-        for validator_name, args in parsed:
-            # Check if the validator is registered for this element.
-            # The validators in `format` that are not registered for this element
-            # will be ignored (with an error or warning, depending on the value of
-            # `strict`), and the registered validators will be returned.
-            if validator_name not in types_to_validators[self.element.tag]:
-                if strict:
-                    raise ValueError(
-                        f"Validator {validator_name} is not valid for"
-                        f" element {self.element.tag}."
-                    )
-                else:
-                    warnings.warn(
-                        f"Validator {validator_name} is not valid for"
-                        f" element {self.element.tag}."
-                    )
-                    _unregistered_validators.append(validator_name)
-                continue
+        # Check if the validators are registered for this element.
+        # The validators in `format` that are not registered for this element
+        # will be ignored (with an error or warning, depending on the value of
+        # `strict`), and the registered validators will be returned.
+        for validator_name in unregistered:
+            if strict:
+                raise ValueError(
+                    f"Validator {validator_name} is not valid for element {tag}."
+                )
+            warnings.warn(f"Validator {validator_name} is not valid for element {tag}.")
 
+        attrib = self.element.attrib
+        _validators = []
+        _unregistered_validators = list(unregistered)
+        for validator_name, args in registered:
             validator = validators_registry[validator_name]
 
             # See if the formatter has an associated on_fail method.
-            on_fail = None
-            on_fail_attr_name = f"on-fail-{validator_name}"
-            if on_fail_attr_name in self.element.attrib:
-                on_fail = self.element.attrib[on_fail_attr_name]
-                # TODO(shreya): Load the on_fail method.
-                # This method should be loaded from an optional script given at the
-                # beginning of a rail file.
+            # TODO(shreya): Load the on_fail method.
+            # This method should be loaded from an optional script given at the
+            # beginning of a rail file.
+            on_fail = attrib.get(f"on-fail-{validator_name}")
 
             # Create the validator.
             _validators.append(validator(*args, on_fail=on_fail))
 
-        self._validators = _validators
+        # Stored as a tuple: it is iterated for every validated value.
+        self._validators = tuple(_validators)
         self._unregistered_validators = _unregistered_validators
-        return _validators
+        return self._validators
 
     def to_prompt(self, with_keywords: bool = True) -> str:
         """Convert the format string to another string representation for use
@@ -261,10 +337,19 @@ class FormatAttr:
         """
         if self.format is None:
             return ""
+        try:
+            validators = self.validators
+            unregistered_validators = self.unregistered_validators
+        except AttributeError:
+            # `get_validators` hasn't been called, so there is nothing to show.
+            return ""
+        if not validators and not unregistered_validators:
+            return ""
+
         # Use the validators' to_prompt method to convert the format string to
         # another string representation.
-        prompt = "; ".join([v.to_prompt(with_keywords) for v in self.validators])
-        unreg_prompt = "; ".join(self.unregistered_validators)
+        prompt = "; ".join([v.to_prompt(with_keywords) for v in validators])
+        unreg_prompt = "; ".join(unregistered_validators)
         if prompt and unreg_prompt:
             prompt += f"; {unreg_prompt}"
         elif unreg_prompt:
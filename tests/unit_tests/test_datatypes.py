@@ -1,8 +1,19 @@
+from typing import Any, Dict
+
 import pytest
+from lxml import etree as ET
 from lxml.builder import E
+from pydantic import BaseModel
 
 import guardrails.datatypes as datatypes
 from guardrails.schema import FormatAttr
+from guardrails.utils import pydantic_utils
+from guardrails.validators import (
+    PassResult,
+    register_validator,
+    types_to_validators,
+    validators_registry,
+)
 
 
 @pytest.mark.parametrize(
@@ -23,6 +34,12 @@ from guardrails.schema import FormatAttr
             "dummy: {1 + 2} {{'a': 1, 'b': 2}} c d",
             [3, {"a": 1, "b": 2}, "c", "d"],
         ),
+        ("length: { 1 + 2 } {3}", [3, 3]),
+        # Whitespace inside nested braces does not split the argument.
+        ("dummy: {{'a': {'b': 1}}} c", [{"a": {"b": 1}}, "c"]),
+        # Single quotes do not group arguments; only curly braces do.
+        ("dummy: {1 + 2} 'x y'", [3, "'x", "y'"]),
+        ("dummy: {x y}'", ["{x y}'"]),
     ],
 )
 def test_get_args(input_string, expected):
@@ -30,6 +47,29 @@ def test_get_args(input_string, expected):
     assert args == expected
 
 
+@pytest.mark.parametrize(
+    "format_string, expected",
+    [
+        ("valid-url; is-reachable", ["valid-url", " is-reachable"]),
+        ("a;;b", ["a", "b"]),
+        ("a: {x; y}; b", ["a: {x; y}", " b"]),
+        ("a: {{'k': {1; 2}}}; b", ["a: {{'k': {1; 2}}}", " b"]),
+    ],
+)
+def test_tokens(format_string, expected):
+    assert FormatAttr(format_string).tokens == expected
+
+
+def test_parse_returns_fresh_args():
+    format_attr = FormatAttr("is-in: a b; valid-url")
+    parsed = format_attr.parse()
+    assert parsed == {"is-in": ["a", "b"], "valid-url": []}
+
+    # Mutating a parsed result must not leak into later parses.
+    parsed["is-in"].append("c")
+    assert format_attr.parse() == {"is-in": ["a", "b"], "valid-url": []}
+
+
 @pytest.mark.parametrize(
     "date_format,date",
     [
@@ -49,6 +89,7 @@ def test_date(date_format, date):
     "time_format,time",
     [
         ("%H:%M:%S", "12:00:00"),
+        ("%I:%M %p", "01:30 PM"),
     ],
 )
 def test_time(time_format, time):
@@ -57,3 +98,134 @@ def test_time(time_format, time):
     time_element = E.time(**{"time-format": time_format})
     time_datatype = datatypes.Time.from_xml(time_element)
     assert time_datatype.from_str(time) == datetime.strptime(time, time_format).time()
+
+
+def test_get_validators_uses_per_element_on_fail():
+    fix_element = E.string(format="two-words", **{"on-fail-two-words": "fix"})
+    reask_element = E.string(format="two-words", **{"on-fail-two-words": "reask"})
+
+    fix_validators = FormatAttr.from_element(fix_element).get_validators()
+    reask_validators = FormatAttr.from_element(reask_element).get_validators()
+
+    assert fix_validators[0].on_fail_descriptor == "fix"
+    assert reask_validators[0].on_fail_descriptor == "reask"
+
+
+def test_get_validators_picks_up_validators_registered_later():
+    name = "late-registered-validator"
+    element = E.string(format=name)
+    with pytest.warns(UserWarning):
+        format_attr = FormatAttr.from_element(element)
+        assert not format_attr.get_validators()
+    assert format_attr.unregistered_validators == [name]
+
+    def late_validator(value: Any, metadata: Dict[str, Any]):
+        return PassResult()
+
+    try:
+        register_validator(name, data_type="string")(late_validator)
+        format_attr = FormatAttr.from_element(element)
+        validators = format_attr.get_validators()
+        assert len(validators) == 1
+        assert validators[0].rail_alias == name
+        assert format_attr.unregistered_validators == []
+    finally:
+        validators_registry.pop(name, None)
+        for registered_names in types_to_validators.values():
+            while name in registered_names:
+                registered_names.remove(name)
+
+
+def test_get_validators_warns_for_every_element():
+    elements = [E.string(format="two-words; bogus") for _ in range(2)]
+    with pytest.warns(UserWarning) as record:
+        for element in elements:
+            FormatAttr.from_element(element).get_validators()
+    assert len(record) == 2
+
+    with pytest.raises(ValueError):
+        FormatAttr.from_element(elements[0]).get_validators(strict=True)
+
+
+def test_strict_applies_to_nested_elements():
+    object_element = E.object(E.string(name="a", format="not-a-validator"), name="o")
+    with pytest.raises(ValueError):
+        datatypes.Object.from_xml(object_element, strict=True)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("true", True),
+        ("FALSE", False),
+        ("tRuE", True),
+        (False, False),
+        (None, None),
+    ],
+)
+def test_boolean_from_str(value, expected):
+    bool_datatype = datatypes.Boolean.from_xml(E.bool())
+    assert bool_datatype.from_str(value) is expected
+
+
+@pytest.mark.parametrize("value", ["yes", 1, 0, 1.0, 0.0, ["true"]])
+def test_boolean_from_str_invalid(value):
+    bool_datatype = datatypes.Boolean.from_xml(E.bool())
+    with pytest.raises(ValueError):
+        bool_datatype.from_str(value)
+
+
+def test_format_attr_to_prompt_without_validators():
+    format_attr = FormatAttr("valid-url")
+    # `get_validators` has not been called yet.
+    assert format_attr.to_prompt() == ""
+
+    format_attr = FormatAttr.from_element(E.string(format=""))
+    format_attr.get_validators()
+    assert format_attr.to_prompt() == ""
+
+
+class Person(BaseModel):
+    """A person.
+
+    Args:
+        name: The "full" <name> of the person.
+    """
+
+    name: str
+
+
+def test_pydantic_to_object_element(monkeypatch):
+    monkeypatch.setitem(pydantic_utils.pydantic_models, "Person", Person)
+    monkeypatch.setitem(
+        pydantic_utils.pydantic_validators, Person, {"__root__": {}, "name": {}}
+    )
+
+    parent = E.output(
+        E.pydantic(name="person", description='A "quoted" <person>', model="Person")
+    )
+    pydantic_datatype = datatypes.Pydantic.from_xml(parent[0])
+
+    object_element = pydantic_datatype.to_object_element()
+    assert object_element.tag == "object"
+    assert object_element.get("description") == 'A "quoted" <person>'
+    assert object_element.get("pydantic") == "Person"
+    (field_element,) = object_element
+    assert field_element.tag == "string"
+    assert field_element.get("name") == "name"
+    assert field_element.get("description") == 'The "full" <name> of the person.'
+
+    # Attribute values are escaped when serialized.
+    serialized = ET.tostring(object_element)
+    assert b"&lt;person&gt;" in serialized
+    assert ET.tostring(ET.fromstring(serialized)) == serialized
+
+    # Each call returns an equal but distinct element.
+    other_element = pydantic_datatype.to_object_element()
+    assert other_element is not object_element
+    assert ET.tostring(other_element) == serialized
+
+    # The returned element can be spliced into the caller's tree.
+    parent.replace(parent[0], object_element)
+    assert parent[0] is object_element
+    assert ET.tostring(pydantic_datatype.to_object_element()) == serialized